@@ -0,0 +1,9 @@
+from .log import CaptureWriter, CaptureReader, Direction
+from .replay import Replayer
+
+__all__ = [
+    "CaptureWriter",
+    "CaptureReader",
+    "Direction",
+    "Replayer",
+]
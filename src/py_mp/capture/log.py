@@ -0,0 +1,186 @@
+import mmap as _mmap
+import struct as _struct
+import threading as _threading
+import time as _time
+from enum import IntEnum as _IntEnum
+from typing import Iterator as _Iterator
+
+from py_mp.models import CaptureRecord as _CaptureRecord
+
+MAGIC: bytes = b"PYMPCAP1"
+# Magic followed by the wall clock time (ns) the log was created at
+FILE_HEADER = _struct.Struct(">8sQ")
+# Timestamp (ns since the capture session started), session id, direction, client id, payload length
+RECORD_HEADER = _struct.Struct(">QIBII")
+
+
+class Direction(_IntEnum):
+    """
+    Direction of a captured frame, seen from the server
+    """
+    INBOUND = 0
+    OUTBOUND = 1
+
+
+class CaptureWriter:
+    def __init__(self, path: str) -> None:
+        """
+        Initializes all the variables in the class and prepares them for use.
+
+        Append-only writer for the binary capture log. Every writer records a new capture session,
+        if the file already exists the records of the session are appended to it with the next
+        session id. The timestamps of the records count from the start of their session.
+
+        Parameters
+        ----------
+        path: str
+            The path of the capture log
+        """
+        self.path: str = path
+        self._lock: _threading.Lock = _threading.Lock()
+        self._file = open(path, "ab")  # pylint: disable=consider-using-with
+        try:
+            if self._file.tell() == 0:
+                self.created: int = _time.time_ns()
+                self.session: int = 0
+                self._file.write(FILE_HEADER.pack(MAGIC, self.created))
+            else:
+                with CaptureReader(path) as reader:
+                    self.created = reader.created
+                    last_session, end = reader._tail()
+                # Drop a truncated record a crashed session left behind
+                self._file.truncate(end)
+                self.session = last_session + 1
+        except BaseException:
+            self._file.close()
+            raise
+        self._origin: int = _time.monotonic_ns()
+
+    def __repr__(self) -> str:
+        return f"<CaptureWriter {self.path} {'closed' if self.closed else 'open'}>"
+
+    def __enter__(self) -> "CaptureWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def record(self, direction: Direction, client_id: int, payload: bytes) -> None:
+        """Append a frame to the capture log
+
+        Parameters
+        ----------
+        direction : Direction
+            Whether the frame was received or sent by the server
+        client_id : int
+            The id of the client the frame was received from or sent to
+        payload : bytes
+            The encoded frame
+        """
+        timestamp = _time.monotonic_ns() - self._origin
+        with self._lock:
+            self._file.write(RECORD_HEADER.pack(timestamp, self.session, direction, client_id, len(payload)))
+            self._file.write(payload)
+
+    def flush(self) -> None:
+        """Flush the buffered records to the capture log"""
+        with self._lock:
+            self._file.flush()
+
+    def close(self) -> None:
+        """Flush the buffered records and close the capture log"""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+class CaptureReader:
+    def __init__(self, path: str) -> None:
+        """
+        Initializes all the variables in the class and prepares them for use.
+
+        Reader for the binary capture log. The file is memory-mapped and the payloads of the
+        records are handed out as memoryviews into the mapping, so nothing is copied.
+
+        Parameters
+        ----------
+        path: str
+            The path of the capture log
+
+        Raises
+        ------
+        ValueError
+            The file is not a capture log
+        """
+        self.path: str = path
+        with open(path, "rb") as file:
+            self._map: _mmap.mmap = _mmap.mmap(file.fileno(), 0, access=_mmap.ACCESS_READ)
+        self.created: int = _read_header(self._map[:FILE_HEADER.size])
+
+    def __repr__(self) -> str:
+        return f"<CaptureReader {self.path} ({len(self._map)} bytes)>"
+
+    def __enter__(self) -> "CaptureReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __iter__(self) -> _Iterator[_CaptureRecord]:
+        """Iterate over all the complete records of the capture log
+
+        A truncated record at the end of the log (e.g. the server crashed while writing) is ignored.
+
+        Yields
+        ------
+        CaptureRecord
+            The records in the order they were written
+        """
+        view = memoryview(self._map)
+        try:
+            for offset, (timestamp, session, direction, client_id, length) in self._headers():
+                yield _CaptureRecord(timestamp, session, direction, client_id, view[offset:offset + length])
+        finally:
+            view.release()
+
+    def _tail(self) -> tuple[int, int]:
+        # Session id of the last complete record (-1 if there is none) and the offset behind it
+        session, end = -1, FILE_HEADER.size
+        for offset, header in self._headers():
+            session, end = header[1], offset + header[-1]
+        return session, end
+
+    def _headers(self) -> _Iterator[tuple[int, tuple[int, int, int, int, int]]]:
+        end = len(self._map)
+        offset = FILE_HEADER.size
+        while offset + RECORD_HEADER.size <= end:
+            header = RECORD_HEADER.unpack_from(self._map, offset)
+            offset += RECORD_HEADER.size
+            if offset + header[-1] > end:
+                return
+            yield offset, header
+            offset += header[-1]
+
+    def close(self) -> None:
+        """Release the memory-map of the capture log
+
+        If payloads handed out by the reader are still alive, the memory-map stays open
+        until the last of them is garbage collected.
+        """
+        try:
+            self._map.close()
+        except BufferError:
+            pass
+
+
+def _read_header(data: bytes) -> int:
+    if len(data) < FILE_HEADER.size:
+        raise ValueError("Not a capture log")
+    magic, created = FILE_HEADER.unpack(data)
+    if magic != MAGIC:
+        raise ValueError("Not a capture log")
+    return created
@@ -0,0 +1,177 @@
+import argparse as _argparse
+import threading as _threading
+import time as _time
+
+from py_mp.models import CaptureRecord as _CaptureRecord, ReplayStats as _ReplayStats
+from py_mp.network.client import NetworkClient as _NetworkClient
+from py_mp.network.transport import TCPTransport as _TCPTransport, UnixTransport as _UnixTransport
+from py_mp.capture.log import CaptureReader as _CaptureReader, Direction as _Direction
+
+
+class Replayer:
+    def __init__(self, path: str, speed: float = 1.0, scale: int = 1, timeout: float | None = 10.0,
+                 **client_kwargs) -> None:
+        """
+        Initializes all the variables in the class and prepares them for use.
+
+        Replays a capture log against a running server. Every client of the capture is simulated
+        by its own NetworkClient in its own thread, which sends the inbound frames of the capture
+        and receives as many frames as the server sent to the client during the capture. A simulated
+        client that waits longer than the timeout for a frame ends its session with an error.
+
+        Parameters
+        ----------
+        path: str
+            The path of the capture log
+        speed: float, by default 1.0
+            The speed factor of the replay, 1.0 replays the capture in its original timing,
+            0 replays it as fast as possible
+        scale: int, by default 1
+            How many simulated clients are started for each client of the capture
+        timeout: float | None, by default 10.0
+            The time in seconds a simulated client waits for the server, None waits forever
+        client_kwargs
+            Additional arguments passed to every simulated NetworkClient, e.g. the transport
+        """
+        if speed < 0:
+            raise ValueError("The speed of the replay can't be negative")
+        if scale < 1:
+            raise ValueError("At least one simulated client per captured client is required")
+        self.path: str = path
+        self.speed: float = speed
+        self.scale: int = scale
+        self.timeout: float | None = timeout
+        self.client_kwargs: dict = client_kwargs
+
+    def __repr__(self) -> str:
+        return f"<Replayer {self.path} speed: {self.speed or 'max'} scale: {self.scale}>"
+
+    def replay(self, host: str | None = None, port: int | None = None) -> _ReplayStats:
+        """Replay the capture log against a server
+
+        The simulated clients are connected in the order of the capture sessions and client ids
+        of the capture, so the server sees them in the same order as during the capture. Every
+        capture session of the log is replayed from its first frame on, all at the same time.
+
+        Parameters
+        ----------
+        host : str | None, by default None
+            The Hostname or IP address of the server to replay the capture against,
+            may only be omitted if the transport of client_kwargs does not need it
+        port : int | None, by default None
+            The Port of the server to replay the capture against,
+            may only be omitted if the transport of client_kwargs does not need it
+
+        Returns
+        -------
+        ReplayStats
+            The statistics of the replay
+
+        Raises
+        ------
+        ValueError
+            The transport of the simulated clients can't create an address from the given host and port
+        """
+        transport = self.client_kwargs.get("transport") or _TCPTransport()
+        if transport.address(host, port) is None:
+            raise ValueError("No address to connect to")
+        stats = _ReplayStats()
+        lock = _threading.Lock()
+        with _CaptureReader(self.path) as reader:
+            sessions: dict[tuple[int, int], list[_CaptureRecord]] = {}
+            origins: dict[int, int] = {}
+            clients: list[tuple[_NetworkClient, list[_CaptureRecord], int]] = []
+            try:
+                for record in reader:
+                    sessions.setdefault((record.session, record.client_id), []).append(record)
+                    origins[record.session] = min(origins.get(record.session, record.timestamp), record.timestamp)
+
+                for _ in range(self.scale):
+                    for key in sorted(sessions):
+                        client = _NetworkClient(auto_connect=False, **self.client_kwargs)
+                        clients.append((client, sessions[key], origins[key[0]]))
+                        client.connect(host, port)
+                        client.conn.settimeout(self.timeout)
+
+                start = _time.perf_counter()
+                threads = [
+                    _threading.Thread(target=self._run_session, args=(client, records, origin, start, stats, lock),
+                                      daemon=True)
+                    for client, records, origin in clients
+                ]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                stats.elapsed = _time.perf_counter() - start
+            finally:
+                for client, _, _ in clients:
+                    if client.conn is not None:
+                        client.conn.close()
+                for records in sessions.values():
+                    for record in records:
+                        record.payload.release()
+        return stats
+
+    def _run_session(self, client: _NetworkClient, records: list[_CaptureRecord], origin: int, start: float,
+                     stats: _ReplayStats, lock: _threading.Lock) -> None:
+        sent = received = bytes_sent = bytes_received = 0
+        try:
+            for record in records:
+                if self.speed:
+                    delay = start + (record.timestamp - origin) / 1_000_000_000 / self.speed - _time.perf_counter()
+                    if delay > 0:
+                        _time.sleep(delay)
+                if record.direction == _Direction.INBOUND:
+                    client._send_frame(record.payload)  # pylint: disable=protected-access
+                    sent += 1
+                    bytes_sent += len(record.payload)
+                else:
+                    bytes_received += len(client._recv_frame())  # pylint: disable=protected-access
+                    received += 1
+        except OSError as exc:
+            # Includes socket.timeout if the server did not answer like during the capture
+            with lock:
+                stats.errors.append(exc)
+        with lock:
+            stats.frames_sent += sent
+            stats.frames_received += received
+            stats.bytes_sent += bytes_sent
+            stats.bytes_received += bytes_received
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command line entry point of the replay tool
+
+    Parameters
+    ----------
+    argv : list[str] | None, by default None
+        The command line arguments, sys.argv is used if None
+    """
+    parser = _argparse.ArgumentParser(description="Replay a py_mp capture log against a server")
+    parser.add_argument("path", help="the capture log to replay")
+    parser.add_argument("host", nargs="?", help="the hostname of the server")
+    parser.add_argument("port", nargs="?", type=int, help="the port of the server")
+    parser.add_argument("--unix", metavar="PATH", help="connect to the Unix domain socket at PATH instead")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="speed factor of the replay, 0 replays as fast as possible (default: 1.0)")
+    parser.add_argument("--scale", type=int, default=1,
+                        help="simulated clients per captured client (default: 1)")
+    parser.add_argument("--timeout", type=float, default=10.0,
+                        help="seconds a simulated client waits for the server, 0 waits forever (default: 10.0)")
+    args = parser.parse_args(argv)
+    client_kwargs = {}
+    if args.unix:
+        client_kwargs["transport"] = _UnixTransport(args.unix)
+    elif not (args.host and args.port):
+        parser.error("either host and port or --unix are required")
+
+    stats = Replayer(args.path, args.speed, args.scale, args.timeout or None, **client_kwargs) \
+        .replay(args.host, args.port)
+    print(f"sent {stats.frames_sent} frames ({stats.bytes_sent} bytes), "
+          f"received {stats.frames_received} frames ({stats.bytes_received} bytes) "
+          f"in {stats.elapsed:.3f}s with {len(stats.errors)} errors")
+
+
+if __name__ == '__main__':
+    main()
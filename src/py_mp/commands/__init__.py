@@ -1,8 +1,9 @@
-from .commands import BaseCommand, ClientCommand, ServerCommand, ServerSideClientCommand, ServerSideServerCommand
+from .commands import BaseCommand, LazyCommand, ClientCommand, ServerCommand, ServerSideClientCommand, ServerSideServerCommand
 from .flags import CommandFlag, NetworkFlag
 
 __all__ = [
     "BaseCommand",
+    "LazyCommand",
     "ClientCommand",
     "ServerCommand",
     "ServerSideClientCommand",
@@ -4,6 +4,15 @@ from py_mp.models import ClientBaseModel as _ClientBase
 from py_mp.commands.flags import CommandFlag as _CommandFlag, NetworkFlag as _NetworkFlag
 
 
+_FLAG_PREFIX = b'{"flag": '
+
+
+def _to_flag(value: int) -> _CommandFlag:
+    if _NetworkFlag(value) in _NetworkFlag:
+        return _NetworkFlag(value)
+    return _CommandFlag(value)
+
+
 class BaseCommand:
     def __init__(self, flag: _CommandFlag, **kwargs):
         """
@@ -51,11 +60,98 @@ class BaseCommand:
             The deserialized command
         """
         data = json.loads(serial)
-        if _NetworkFlag(data.get("flag")) in _NetworkFlag:
-            flg = _NetworkFlag(data.get("flag"))
-        else:
-            flg = _CommandFlag(data.get("flag"))
-        return cls(flg, **data.get("args", {}))
+        return cls(_to_flag(data.get("flag")), **data.get("args", {}))
+
+
+class LazyCommand(BaseCommand):
+    def __init__(self, frame: bytes | memoryview, client: _ClientBase | None = None, encoding: str = "utf-8"):
+        """
+        Initializes all the variables in the class and prepares them for use.
+
+        Command that is decoded lazily from a received frame. Only the flag is read from the
+        start of the frame, the arguments are parsed on their first access. As long as the
+        arguments are unchanged, the command is forwarded as the original frame.
+
+        Parameters
+        ----------
+        frame: bytes | memoryview
+            The received frame of the serialized command
+        client: ClientBase | None, by default None
+            The client that sent the command
+        encoding: str, by default "utf-8"
+            The encoding of the frame
+        """
+        self.raw: memoryview = memoryview(frame)
+        self.client: _ClientBase | None = client
+        self.encoding: str = encoding
+        flag, args = self._parse_flag()
+        super().__init__(flag)
+        # BaseCommand.__init__ assigned empty args, leave them to be parsed on first access
+        self._args: dict | None = args
+        self._assigned: bool = False
+
+    def __repr__(self):
+        args = ', '.join(self._args.keys()) if self._args is not None else '...'
+        return f"<LazyCommand [{self.flag.name}] args: {args})>"
+
+    @property
+    def args(self) -> dict:
+        """
+        The arguments of the command, parsed on the first access
+
+        Changes to the arguments (in place or by assignment) are forwarded.
+        """
+        if self._args is None:
+            self._args = self._parse_args()
+        return self._args
+
+    @args.setter
+    def args(self, value: dict):
+        self._args = value
+        self._assigned = True
+
+    @property
+    def frame(self) -> bytes | memoryview:
+        """
+        The frame to send the command with, the original frame if the arguments are unchanged
+        """
+        if self._changed():
+            return self.serialize().encode(self.encoding)
+        return self.raw
+
+    def serialize(self) -> str:
+        """
+        Serializes the command into a string
+
+        Returns
+        -------
+        str
+            The serialized command, the decoded original frame if the arguments are unchanged
+        """
+        if self._changed():
+            return super().serialize()
+        return self.raw.tobytes().decode(self.encoding)
+
+    def _changed(self) -> bool:
+        # Arguments that were handed out may have been changed in place, compare them with the frame
+        return self._assigned or self._args is not None and self._args != self._parse_args()
+
+    def _parse_args(self) -> dict:
+        return json.loads(self.raw.tobytes().decode(self.encoding)).get("args", {})
+
+    def _parse_flag(self) -> tuple[_CommandFlag, dict | None]:
+        # BaseCommand.serialize always writes the flag first: {"flag": <int>, "args": ...}
+        header = self.raw[:32].tobytes()
+        if header.startswith(_FLAG_PREFIX):
+            end = header.find(b",", len(_FLAG_PREFIX))
+            if end != -1:
+                try:
+                    return _to_flag(int(header[len(_FLAG_PREFIX):end])), None
+                except ValueError:
+                    pass
+        # Frame not written by BaseCommand.serialize, parse it completely
+        data = json.loads(self.raw.tobytes().decode(self.encoding))
+        return _to_flag(data.get("flag")), data.get("args", {})
 
 
 class ClientCommand(BaseCommand):
@@ -1,5 +1,8 @@
 from .network import ClientBaseModel
+from .capture import CaptureRecord, ReplayStats
 
 __all__ = [
-    "ClientBaseModel"
+    "ClientBaseModel",
+    "CaptureRecord",
+    "ReplayStats",
 ]
@@ -0,0 +1,24 @@
+from dataclasses import dataclass as _dc, field as _field
+
+
+@_dc
+class CaptureRecord:
+    timestamp: int
+    session: int
+    direction: int
+    client_id: int
+    payload: memoryview
+
+    @property
+    def seconds(self) -> float:
+        return self.timestamp / 1_000_000_000
+
+
+@_dc
+class ReplayStats:
+    frames_sent: int = 0
+    frames_received: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    elapsed: float = 0.0
+    errors: list[Exception] = _field(default_factory=list)
@@ -1,5 +1,7 @@
 from .client import NetworkClientBase, NetworkClient, CommandClient
 from .server import NetworkServerBase, NetworkServer, CommandServer
+from .transport import TransportBase, TCPTransport, UnixTransport, SocketPairTransport
+from .snapshot import SnapshotBuffer
 
 __all__ = [
     "NetworkClientBase",
@@ -8,4 +10,9 @@ __all__ = [
     "NetworkServerBase",
     "NetworkServer",
     "CommandServer",
+    "TransportBase",
+    "TCPTransport",
+    "UnixTransport",
+    "SocketPairTransport",
+    "SnapshotBuffer",
 ]
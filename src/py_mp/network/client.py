@@ -1,10 +1,14 @@
 import socket as _sock
+from typing import Any as _Any
 from py_mp.commands import ClientCommand as _ClientCommand, \
     ServerCommand as _ServerCommand, BaseCommand as _BaseCommand
+from py_mp.network.transport import TransportBase as _TransportBase, TCPTransport as _TCPTransport
+from py_mp.network.snapshot import SnapshotBuffer as _SnapshotBuffer
 
 
 class NetworkClientBase:
-    def __init__(self, host: str | None = None, port: int | None = None, auto_connect: bool = True) -> None:
+    def __init__(self, host: str | None = None, port: int | None = None, auto_connect: bool = True,
+                 transport: _TransportBase | None = None) -> None:
         """
         Initializes all the variables in the class and prepares them for use.
 
@@ -16,36 +20,47 @@ class NetworkClientBase:
                 Specify the port to connect to
             auto_connect: bool, by default True
                 Automatically connect the socket to a port and host
+            transport: TransportBase | None, by default None
+                The transport to communicate over, TCPTransport if None
         """
-        self.conn: _sock.socket = _sock.socket(_sock.AF_INET, _sock.SOCK_STREAM)
+        self.transport: _TransportBase = transport if transport is not None else _TCPTransport()
+        self.conn: _sock.socket | None = self.transport.create_socket()
         self._connected: bool = False
-        self.addr: tuple[str, int] | None = None
+        self.addr: _Any | None = None
 
         if auto_connect:
-            if host and port:
+            if self.transport.address(host, port) is not None:
                 self.connect(host, port)
 
     def __repr__(self) -> str:
         return f"<NetworkClientBase " \
-               f"{f'connected ({self.addr[0]}:{self.addr[1]})' if self.is_connected() else 'not connected'}>"
+               f"{f'connected ({self.transport.describe(self.addr)})' if self.is_connected() else 'not connected'}>"
 
-    def connect(self,  host: str, port: int):
+    def connect(self, host: str | None = None, port: int | None = None):
         """Connect the socket to a host and port
 
         Parameters
         ----------
-        host : str
-            The Hostname or IP address of the server to connect to
-        port : int
+        host : str | None, by default None
+            The Hostname or IP address of the server to connect to (the path of the socket file for a UnixTransport)
+        port : int | None, by default None
             The Port of the server to connect to
 
         Returns
         -------
         socket.socket
             The socket object that is connected to the given host and port
+
+        Raises
+        ------
+        ValueError
+            The transport can't create an address from the given host and port
         """
-        self.addr = (host, port)
-        self.conn.connect(self.addr)
+        addr = self.transport.address(host, port)
+        if addr is None:
+            raise ValueError("No address to connect to")
+        self.addr = addr
+        self.conn = self.transport.connect(self.conn, self.addr)
         self._connected = True
 
     def _recv(self, size: int) -> bytes:
@@ -119,11 +134,7 @@ class NetworkClient(NetworkClientBase):
         data : bytes
             The data to send to the server
         """
-        data = data.encode(self.ENCODING)
-        length = len(data)
-        self._send(length.to_bytes(8, "big"))
-        if int.from_bytes(self._recv(8), "big") == length:
-            self._send(data)
+        self._send_frame(data.encode(self.ENCODING))
 
     def recv(self) -> str:
         """Receive data from the server
@@ -133,19 +144,48 @@ class NetworkClient(NetworkClientBase):
         str
             The received data
         """
+        return self._recv_frame().decode(self.ENCODING)
+
+    def _send_frame(self, data: bytes):
+        """Send an already encoded frame to the server using the length handshake
+
+        Parameters
+        ----------
+        data : bytes
+            The encoded frame to send to the server
+        """
+        length = len(data)
+        self._send(length.to_bytes(8, "big"))
+        if int.from_bytes(self._recv(8), "big") == length:
+            self._send(data)
+
+    def _recv_frame(self) -> bytes:
+        """Receive an encoded frame from the server using the length handshake
+
+        Returns
+        -------
+        bytes
+            The received frame
+        """
         length = int.from_bytes(self._recv(8), "big")
         self._send(length.to_bytes(8, "big"))
-        return self._recv(length).decode(self.ENCODING)
+        return self._recv(length)
 
 
 class CommandClient(NetworkClient):
-    def __init__(self, *args, **kwargs) -> None:
+    def __init__(self, *args, snapshots: _SnapshotBuffer | None = None, **kwargs) -> None:
         """
         Initializes all the variables in the class and prepares them for use.
 
         The difference between this class and the NetworkClient class is that this class
         sends and receives data as strings instead of bytes.
+
+        Parameters
+        ----------
+            snapshots: SnapshotBuffer | None, by default None
+                The buffer the received state commands are timestamped and stored in
         """
+        self.snapshots: _SnapshotBuffer | None = snapshots
         super().__init__(*args, **kwargs)
 
     def send(self, command: _ClientCommand | _ServerCommand):
@@ -161,12 +201,17 @@ class CommandClient(NetworkClient):
     def recv(self) -> _BaseCommand:
         """Receive data from the server
 
+        If the client has a snapshot buffer, the received command is also pushed to it.
+
         Returns
         -------
         str
             The received data
         """
-        return _BaseCommand.deserialize(super().recv())
+        command = _BaseCommand.deserialize(super().recv())
+        if self.snapshots is not None:
+            self.snapshots.push(command)
+        return command
 
 
 if __name__ == '__main__':
@@ -1,10 +1,14 @@
 import socket as _sock
+from typing import Any as _Any
 from py_mp.models import ClientBaseModel as _ClientBase
-from py_mp.commands import ClientCommand as _ClientCommand, ServerCommand as _ServerCommand, BaseCommand as _BaseCommand, ServerSideClientCommand as _ServerSideClientCommand, ServerSideServerCommand as _ServerSideServerCommand
+from py_mp.capture.log import CaptureWriter as _CaptureWriter, Direction as _Direction
+from py_mp.network.transport import TransportBase as _TransportBase, TCPTransport as _TCPTransport
+from py_mp.commands import ClientCommand as _ClientCommand, ServerCommand as _ServerCommand, BaseCommand as _BaseCommand, ServerSideClientCommand as _ServerSideClientCommand, ServerSideServerCommand as _ServerSideServerCommand, LazyCommand as _LazyCommand
 
 
 class NetworkServerBase:
-    def __init__(self, host: str | None = None, port: int | None = None, auto_bind: bool = True) -> None:
+    def __init__(self, host: str | None = None, port: int | None = None, auto_bind: bool = True,
+                 transport: _TransportBase | None = None) -> None:
         """
         Initializes all the variables in the class and prepares them for use.
 
@@ -16,37 +20,49 @@ class NetworkServerBase:
                 Specify the port to bind to
             auto_bind: bool, by default True
                 Automatically bind the socket to a port and host
+            transport: TransportBase | None, by default None
+                The transport to communicate over, TCPTransport if None
         """
-        self.conn: _sock.socket = _sock.socket(_sock.AF_INET, _sock.SOCK_STREAM)
+        self.transport: _TransportBase = transport if transport is not None else _TCPTransport()
+        self.conn: _sock.socket | None = self.transport.create_socket()
         self._binded: bool = False
-        self.addr: tuple[str, int] | None = None
+        self.addr: _Any | None = None
         self.clients: list[_ClientBase] = []
 
         # Auto-bind
         if auto_bind:
-            if host and port:
+            if self.transport.address(host, port) is not None:
                 self.bind(host, port)
 
     def __repr__(self) -> str:
-        return f"<NetworkServerBase {f'binded ({self.addr[0]}:{self.addr[1]})' if self.is_binded() else 'not binded'}>"
+        return f"<NetworkServerBase " \
+               f"{f'binded ({self.transport.describe(self.addr)})' if self.is_binded() else 'not binded'}>"
 
-    def bind(self,  host: str, port: int) -> _sock.socket:
+    def bind(self, host: str | None = None, port: int | None = None) -> _sock.socket | None:
         """Bind the socket to a host and port
 
         Parameters
         ----------
-        host : str
-            The Hostname or IP address to bind the server to
-        port : int
+        host : str | None, by default None
+            The Hostname or IP address to bind the server to (the path of the socket file for a UnixTransport)
+        port : int | None, by default None
             The Port to bind the server to
 
         Returns
         -------
-        socket.socket
+        socket.socket | None
             The socket object that is binded to the given host and port
+
+        Raises
+        ------
+        ValueError
+            The transport can't create an address from the given host and port
         """
-        self.addr = (host, port)
-        self.conn.bind(self.addr)
+        addr = self.transport.address(host, port)
+        if addr is None:
+            raise ValueError("No address to bind to")
+        self.addr = addr
+        self.transport.bind(self.conn, self.addr)
         self._binded = True
         return self.conn
 
@@ -65,9 +81,9 @@ class NetworkServerBase:
         """
         if not self.is_binded():
             raise ConnectionError("Not binded to any addr")
-        self.conn.listen(amount)
+        self.transport.listen(self.conn, amount)
         while len(self.clients) < amount:
-            self.clients.append(_ClientBase.from_accept(*self.conn.accept()))
+            self.clients.append(self.transport.accept(self.conn))
 
     def _recv(self, size: int, client: _ClientBase) -> bytes:
         """Wrapper of the socket.recv() method including a check if the socket is binded to a host and port
@@ -136,6 +152,7 @@ class NetworkServer(NetworkServerBase):
         automatically sends the length of the data to the client and then sends the data
         """
         self.ENCODING: str = "utf-8"
+        self.capture: _CaptureWriter | None = None
         super().__init__(*args, **kwargs)
 
     def accept(self, amount: int = 1) -> None:
@@ -160,11 +177,7 @@ class NetworkServer(NetworkServerBase):
         """
         if client not in self.clients:
             raise ConnectionError("Client not connected")
-        data = data.encode(self.ENCODING)
-        length = len(data)
-        self._send(length.to_bytes(8, "big"), client)
-        if int.from_bytes(self._recv(8, client), "big") == length:
-            self._send(data, client)
+        self._send_frame(data.encode(self.ENCODING), client)
 
     def send_to(self, data: str, *clients: _ClientBase) -> None:
         """Send data to several clients
@@ -205,10 +218,67 @@ class NetworkServer(NetworkServerBase):
         """
         if client not in self.clients:
             raise ConnectionError("Client not connected")
+        return self._recv_frame(client).decode(self.ENCODING)
 
+    def _send_frame(self, data: bytes, client: _ClientBase) -> None:
+        """Send an already encoded frame to a client using the length handshake
+
+        Parameters
+        ----------
+        data : bytes
+            The encoded frame to send to the client
+        client : ClientBase
+            The client to send the frame to
+        """
+        length = len(data)
+        self._send(length.to_bytes(8, "big"), client)
+        if int.from_bytes(self._recv(8, client), "big") == length:
+            self._send(data, client)
+            if self.capture is not None:
+                self.capture.record(_Direction.OUTBOUND, self.clients.index(client), data)
+
+    def _recv_frame(self, client: _ClientBase) -> bytes:
+        """Receive an encoded frame from a client using the length handshake
+
+        Parameters
+        ----------
+        client : ClientBase
+            The client to receive the frame from
+
+        Returns
+        -------
+        bytes
+            The received frame
+        """
         length = int.from_bytes(self._recv(8, client), "big")
         self._send(length.to_bytes(8, "big"), client)
-        return self._recv(length, client).decode(self.ENCODING)
+        data = self._recv(length, client)
+        if self.capture is not None:
+            self.capture.record(_Direction.INBOUND, self.clients.index(client), data)
+        return data
+
+    def start_capture(self, path: str) -> _CaptureWriter:
+        """Start recording every frame sent and received by the server
+
+        Parameters
+        ----------
+        path : str
+            The path of the capture log, new records are appended to an existing log
+
+        Returns
+        -------
+        CaptureWriter
+            The writer the frames are recorded with
+        """
+        self.stop_capture()
+        self.capture = _CaptureWriter(path)
+        return self.capture
+
+    def stop_capture(self) -> None:
+        """Stop recording frames and close the capture log"""
+        if self.capture is not None:
+            self.capture.close()
+            self.capture = None
 
 
 class CommandServer(NetworkServer):
@@ -221,26 +291,30 @@ class CommandServer(NetworkServer):
         """
         super().__init__(*args, **kwargs)
 
-    def send(self, command: _ServerCommand | _ServerSideServerCommand, client: _ClientBase) -> None:
+    def send(self, command: _ServerCommand | _ServerSideServerCommand | _LazyCommand, client: _ClientBase) -> None:
         """Send data to the server
 
         Parameters
         ----------
-        command : ClientCommand | ServerCommand
+        command : ClientCommand | ServerCommand | LazyCommand
             The command to send to the server
         client : ClientBase
             The client to send the data to
         """
+        if isinstance(command, _LazyCommand):
+            self.forward(command, client)
+            return
         if isinstance(command, _ServerSideServerCommand):
             command = command.to_client_cmd()
         super().send(command.serialize(), client)
 
-    def send_to(self, command: _ServerCommand | _ServerSideServerCommand, *clients: _ClientBase) -> None:
+    def send_to(self, command: _ServerCommand | _ServerSideServerCommand | _LazyCommand,
+                *clients: _ClientBase) -> None:
         """Send data to several clients
 
         Parameters
         ----------
-        command : ServerCommand | ServerSideServerCommand
+        command : ServerCommand | ServerSideServerCommand | LazyCommand
             The data to send to the client
         clients : list[ClientBase]
             The clients to send the data to
@@ -248,14 +322,17 @@ class CommandServer(NetworkServer):
         for client in clients:
             self.send(command, client)
 
-    def send_all(self, command: _ServerCommand | _ServerSideServerCommand) -> None:
+    def send_all(self, command: _ServerCommand | _ServerSideServerCommand | _LazyCommand) -> None:
         """Send data to all clients
 
         Parameters
         ----------
-        command : ClientCommand | ServerCommand
+        command : ClientCommand | ServerCommand | LazyCommand
             The command to send to the server
         """
+        if isinstance(command, _LazyCommand):
+            self.forward(command, *self.clients)
+            return
         if isinstance(command, _ServerSideServerCommand):
             command = command.to_client_cmd()
         super().send_all(command.serialize())
@@ -275,6 +352,39 @@ class CommandServer(NetworkServer):
         """
         return _ServerSideClientCommand.from_client_cmd(_BaseCommand.deserialize(super().recv(client)), client)
 
+    def recv_lazy(self, client: _ClientBase) -> _LazyCommand:
+        """Receive a command from a client without decoding its arguments
+
+        Parameters
+        ----------
+        client : ClientBase
+            The client to receive the command from
+
+        Returns
+        -------
+        LazyCommand
+            The received command, its arguments are parsed on the first access
+        """
+        if client not in self.clients:
+            raise ConnectionError("Client not connected")
+        return _LazyCommand(self._recv_frame(client), client, self.ENCODING)
+
+    def forward(self, command: _LazyCommand, *clients: _ClientBase) -> None:
+        """Forward a received command to several clients without serializing it again
+
+        Parameters
+        ----------
+        command : LazyCommand
+            The received command to forward
+        clients : list[ClientBase]
+            The clients to forward the command to
+        """
+        frame = command.frame
+        for client in clients:
+            if client not in self.clients:
+                raise ConnectionError("Client not connected")
+            self._send_frame(frame, client)
+
 
 if __name__ == '__main__':
     from py_mp.commands import ServerSideServerCommand, NetworkFlag
@@ -0,0 +1,150 @@
+import bisect as _bisect
+import threading as _threading
+import time as _time
+from collections import deque as _deque
+from typing import Any as _Any, Iterable as _Iterable
+
+from py_mp.commands import BaseCommand as _BaseCommand, ServerCommand as _ServerCommand, \
+    CommandFlag as _CommandFlag
+
+
+class SnapshotBuffer:
+    def __init__(self, flags: _Iterable[_CommandFlag], size: int = 32, delay: float = 0.1) -> None:
+        """
+        Initializes all the variables in the class and prepares them for use.
+
+        Time-ordered ring of the state commands received from the server. Rendering code samples
+        the buffer slightly in the past and gets the state interpolated between the two snapshots
+        around that time, so the server can send updates at a lower rate than the client renders.
+        The buffer can be pushed to from a network thread and sampled from a render thread.
+
+        Parameters
+        ----------
+        flags: Iterable[CommandFlag]
+            The flags of the commands that are snapshots, any other command is ignored
+        size: int, by default 32
+            The maximum amount of snapshots kept, the oldest snapshots are dropped first
+        delay: float, by default 0.1
+            The interpolation delay in seconds used if sample() is called without a render time,
+            should be at least two update intervals of the server
+        """
+        if size < 2:
+            raise ValueError("At least two snapshots are required to interpolate")
+        self.delay: float = delay
+        self.flags: frozenset[_CommandFlag] = frozenset(flags)
+        self._lock: _threading.Lock = _threading.Lock()
+        self._snapshots: _deque[tuple[float, _BaseCommand]] = _deque(maxlen=size)
+
+    def __repr__(self) -> str:
+        return f"<SnapshotBuffer {len(self._snapshots)}/{self._snapshots.maxlen} snapshots>"
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def accepts(self, command: _BaseCommand) -> bool:
+        """Check if a command is a snapshot of the buffer
+
+        Parameters
+        ----------
+        command : BaseCommand
+            The command to check
+
+        Returns
+        -------
+        bool
+            True if the command is stored by push(), False if not
+        """
+        return command.flag in self.flags
+
+    def push(self, command: _BaseCommand, timestamp: float | None = None) -> bool:
+        """Add a snapshot to the buffer
+
+        Parameters
+        ----------
+        command : BaseCommand
+            The received state command
+        timestamp : float | None, by default None
+            The time of the snapshot, time.monotonic() if None
+
+        Returns
+        -------
+        bool
+            True if the command was stored, False if it is not a snapshot of the buffer
+            or older than all the snapshots of a full buffer
+        """
+        if not self.accepts(command):
+            return False
+        if timestamp is None:
+            timestamp = _time.monotonic()
+        with self._lock:
+            snapshots = self._snapshots
+            if not snapshots or timestamp >= snapshots[-1][0]:
+                snapshots.append((timestamp, command))
+                return True
+            # Snapshot arrived out of order
+            if len(snapshots) == snapshots.maxlen:
+                if timestamp < snapshots[0][0]:
+                    return False
+                snapshots.popleft()
+            snapshots.insert(_bisect.bisect_right(snapshots, timestamp, key=lambda snapshot: snapshot[0]),
+                             (timestamp, command))
+            return True
+
+    def clear(self) -> None:
+        """Remove all the snapshots from the buffer"""
+        with self._lock:
+            self._snapshots.clear()
+
+    def sample(self, render_time: float | None = None) -> _ServerCommand | None:
+        """Get the state at a point in time interpolated between the two snapshots around it
+
+        Floats are interpolated linearly, dicts and lists/tuples of the same shape element-wise,
+        any other value (ints like ids or enum values included) is taken from the older snapshot.
+        Snapshots with different flags are not interpolated, the older snapshot is returned.
+        Before the first and after the last snapshot the state of that snapshot is returned,
+        nothing is extrapolated.
+
+        Parameters
+        ----------
+        render_time : float | None, by default None
+            The time to sample (on the clock of the timestamps), time.monotonic() - delay if None
+
+        Returns
+        -------
+        ServerCommand | None
+            A command with the flag of the older snapshot and the interpolated arguments,
+            None if the buffer is empty
+        """
+        if render_time is None:
+            render_time = _time.monotonic() - self.delay
+        with self._lock:
+            snapshots = self._snapshots
+            if not snapshots:
+                return None
+            index = _bisect.bisect_right(snapshots, render_time, key=lambda snapshot: snapshot[0])
+            if index == 0:
+                older = newer = snapshots[0]
+            elif index == len(snapshots):
+                older = newer = snapshots[-1]
+            else:
+                older, newer = snapshots[index - 1], snapshots[index]
+
+        if older is newer or newer[0] == older[0] or older[1].flag != newer[1].flag:
+            return _ServerCommand(older[1].flag, **older[1].args)
+        alpha = (render_time - older[0]) / (newer[0] - older[0])
+        return _ServerCommand(older[1].flag, **_interpolate(older[1].args, newer[1].args, alpha))
+
+
+def _interpolate(older: _Any, newer: _Any, alpha: float) -> _Any:
+    if isinstance(older, bool) or isinstance(newer, bool):
+        return older
+    # Only floats are interpolated, ints are usually ids, counters or enum values
+    if isinstance(older, float) and isinstance(newer, (int, float)) \
+            or isinstance(older, int) and isinstance(newer, float):
+        return older + (newer - older) * alpha
+    if isinstance(older, dict) and isinstance(newer, dict):
+        return {key: _interpolate(value, newer[key], alpha) if key in newer else value
+                for key, value in older.items()}
+    if isinstance(older, (list, tuple)) and isinstance(newer, (list, tuple)) and len(older) == len(newer):
+        return type(older)(_interpolate(old, new, alpha) for old, new in zip(older, newer))
+    return older
@@ -0,0 +1,238 @@
+import errno as _errno
+import os as _os
+import queue as _queue
+import socket as _sock
+import stat as _stat
+from abc import ABC as _ABC, abstractmethod as _abstractmethod
+from typing import Any as _Any
+
+from py_mp.models import ClientBaseModel as _ClientBase
+
+
+class TransportBase(_ABC):
+    """
+    Base Class of the transports the servers and clients communicate over.
+
+    A transport creates the sockets and knows how to bind, accept and connect them,
+    the framing of the data is still done by the servers and clients.
+    """
+    family: int = _sock.AF_INET
+    type: int = _sock.SOCK_STREAM
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}>"
+
+    def create_socket(self) -> _sock.socket | None:
+        """Create the socket a server listens on or a client connects with
+
+        Returns
+        -------
+        socket.socket | None
+            The created socket, None if the transport creates the socket on connect
+        """
+        return _sock.socket(self.family, self.type)
+
+    @_abstractmethod
+    def address(self, host: str | None, port: int | None) -> _Any | None:
+        """Create the address of the transport from a host and port
+
+        Parameters
+        ----------
+        host : str | None
+            The Hostname or IP address
+        port : int | None
+            The Port
+
+        Returns
+        -------
+        Any | None
+            The address of the transport, None if there is not enough information
+        """
+
+    def describe(self, addr: _Any) -> str:
+        """Human-readable representation of an address of the transport
+
+        Parameters
+        ----------
+        addr : Any
+            The address created by the transport
+
+        Returns
+        -------
+        str
+            The representation of the address
+        """
+        return str(addr)
+
+    def bind(self, conn: _sock.socket | None, addr: _Any) -> None:
+        """Bind the socket of a server to an address
+
+        Parameters
+        ----------
+        conn : socket.socket | None
+            The socket of the server
+        addr : Any
+            The address to bind to
+        """
+        conn.bind(addr)
+
+    def listen(self, conn: _sock.socket | None, amount: int) -> None:
+        """Start listening for clients
+
+        Parameters
+        ----------
+        conn : socket.socket | None
+            The socket of the server
+        amount : int
+            The amount of clients to accept
+        """
+        conn.listen(amount)
+
+    @_abstractmethod
+    def accept(self, conn: _sock.socket | None) -> _ClientBase:
+        """Accept a client
+
+        Parameters
+        ----------
+        conn : socket.socket | None
+            The socket of the server
+
+        Returns
+        -------
+        ClientBase
+            The accepted client
+        """
+
+    def connect(self, conn: _sock.socket | None, addr: _Any) -> _sock.socket:
+        """Connect the socket of a client to a server
+
+        Parameters
+        ----------
+        conn : socket.socket | None
+            The socket of the client
+        addr : Any
+            The address of the server
+
+        Returns
+        -------
+        socket.socket
+            The connected socket
+        """
+        conn.connect(addr)
+        return conn
+
+
+class TCPTransport(TransportBase):
+    """
+    Transport over TCP (AF_INET), the default transport of the servers and clients
+    """
+    family = _sock.AF_INET
+
+    def address(self, host: str | None, port: int | None) -> tuple[str, int] | None:
+        if host and port:
+            return host, port
+        return None
+
+    def describe(self, addr: tuple[str, int]) -> str:
+        return f"{addr[0]}:{addr[1]}"
+
+    def accept(self, conn: _sock.socket) -> _ClientBase:
+        return _ClientBase.from_accept(*conn.accept())
+
+
+class UnixTransport(TransportBase):
+    family = getattr(_sock, "AF_UNIX", None)
+
+    def __init__(self, path: str | None = None) -> None:
+        """
+        Initializes all the variables in the class and prepares them for use.
+
+        Transport over a Unix domain socket (AF_UNIX) for servers and clients on the same host.
+
+        Parameters
+        ----------
+        path: str | None, by default None
+            The path of the socket file, if None the host passed to bind/connect is used as path
+        """
+        if self.family is None:
+            raise OSError("Unix domain sockets are not supported on this platform")
+        self.path: str | None = path
+
+    def __repr__(self) -> str:
+        return f"<UnixTransport {self.path}>"
+
+    def address(self, host: str | None, port: int | None) -> str | None:
+        return self.path or host or None
+
+    def bind(self, conn: _sock.socket, addr: str) -> None:
+        """Bind the socket of a server to the path of a socket file
+
+        A socket file left behind by a previous server is removed, a socket file
+        another server is still listening on is not. To find out, a connection to the
+        socket file is tried, a listening server sees it as a client that disconnects at once.
+
+        Parameters
+        ----------
+        conn : socket.socket
+            The socket of the server
+        addr : str
+            The path of the socket file
+
+        Raises
+        ------
+        OSError
+            Another server is listening on the socket file
+        """
+        try:
+            is_socket = _stat.S_ISSOCK(_os.stat(addr).st_mode)
+        except FileNotFoundError:
+            is_socket = False
+        if is_socket:
+            with _sock.socket(self.family, self.type) as probe:
+                try:
+                    probe.connect(addr)
+                except ConnectionRefusedError:
+                    _os.unlink(addr)
+                else:
+                    raise OSError(_errno.EADDRINUSE, "Address already in use", addr)
+        conn.bind(addr)
+
+    def accept(self, conn: _sock.socket) -> _ClientBase:
+        client, addr = conn.accept()
+        # The sockets of clients are usually unnamed, their address is an empty string then
+        return _ClientBase(client, addr, 0)
+
+
+class SocketPairTransport(TransportBase):
+    def __init__(self) -> None:
+        """
+        Initializes all the variables in the class and prepares them for use.
+
+        Transport over connected socket pairs for servers and clients in the same process
+        (or in processes forked after connecting). The same instance has to be passed to the
+        server and the clients, every client connect creates a pair and hands one end of it to
+        the next accept of the server.
+        """
+        self._pending: _queue.Queue[_sock.socket] = _queue.Queue()
+
+    def create_socket(self) -> None:
+        return None
+
+    def address(self, host: str | None, port: int | None) -> str:
+        return "socketpair"
+
+    def bind(self, conn: None, addr: str) -> None:
+        pass
+
+    def listen(self, conn: None, amount: int) -> None:
+        pass
+
+    def accept(self, conn: None) -> _ClientBase:
+        client = self._pending.get()
+        # The ends of a socket pair are unnamed
+        return _ClientBase(client, client.getpeername(), 0)
+
+    def connect(self, conn: None, addr: str) -> _sock.socket:
+        client, server = _sock.socketpair()
+        self._pending.put(server)
+        return client
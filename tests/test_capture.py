@@ -0,0 +1,170 @@
+import gc
+import os
+import tempfile
+import threading
+import time
+import unittest
+import warnings
+
+from py_mp import CommandServer, CommandClient, ClientCommand, ServerCommand
+from py_mp.capture import CaptureWriter, CaptureReader, Direction, Replayer
+from py_mp.capture.log import FILE_HEADER, MAGIC, RECORD_HEADER
+from py_mp.commands import NetworkFlag
+from py_mp.network import SocketPairTransport
+
+
+class CaptureLogTest(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp()
+        os.close(handle)
+        os.remove(self.path)
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def read(self):
+        with CaptureReader(self.path) as reader:
+            records = [(r.session, r.direction, r.client_id, r.payload.tobytes()) for r in reader]
+        return records
+
+    def test_round_trip(self):
+        with CaptureWriter(self.path) as writer:
+            writer.record(Direction.INBOUND, 0, b"ping")
+            writer.record(Direction.OUTBOUND, 1, b"pong")
+        self.assertEqual(self.read(), [(0, Direction.INBOUND, 0, b"ping"), (0, Direction.OUTBOUND, 1, b"pong")])
+
+    def test_timestamps_count_from_session_start(self):
+        with CaptureWriter(self.path) as writer:
+            writer.record(Direction.INBOUND, 0, b"a")
+        with CaptureReader(self.path) as reader:
+            timestamps = [record.timestamp for record in reader]
+        self.assertLess(timestamps[0], 1_000_000_000)
+
+    def test_truncated_tail_is_ignored(self):
+        with CaptureWriter(self.path) as writer:
+            writer.record(Direction.INBOUND, 0, b"complete")
+            writer.record(Direction.INBOUND, 0, b"truncated")
+        os.truncate(self.path, os.path.getsize(self.path) - 3)
+        self.assertEqual(self.read(), [(0, Direction.INBOUND, 0, b"complete")])
+
+    def test_append_starts_new_session(self):
+        with CaptureWriter(self.path) as writer:
+            writer.record(Direction.INBOUND, 0, b"first")
+            writer.record(Direction.INBOUND, 0, b"cut")
+        os.truncate(self.path, os.path.getsize(self.path) - 1)
+        with CaptureWriter(self.path) as writer:
+            writer.record(Direction.INBOUND, 0, b"second")
+        self.assertEqual(self.read(), [(0, Direction.INBOUND, 0, b"first"), (1, Direction.INBOUND, 0, b"second")])
+
+    def test_records_outlive_reader(self):
+        with CaptureWriter(self.path) as writer:
+            writer.record(Direction.INBOUND, 0, b"kept")
+        with CaptureReader(self.path) as reader:
+            records = list(reader)
+        self.assertEqual(records[0].payload.tobytes(), b"kept")
+
+    def test_not_a_capture_log(self):
+        with open(self.path, "wb") as file:
+            file.write(b"something else entirely")
+        with self.assertRaises(ValueError):
+            CaptureReader(self.path)
+
+    def test_writer_does_not_leak_file_of_other_format(self):
+        with open(self.path, "wb") as file:
+            file.write(b"something else entirely")
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            with self.assertRaises(ValueError):
+                CaptureWriter(self.path)
+            gc.collect()
+        self.assertFalse([warning for warning in caught if issubclass(warning.category, ResourceWarning)])
+
+
+class ReplayTest(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp()
+        os.close(handle)
+        os.remove(self.path)
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    @staticmethod
+    def echo(server, amount, rounds):
+        server.accept(amount)
+        for _ in range(rounds):
+            for client in server.clients:
+                command = server.recv(client)
+                server.send(ServerCommand(NetworkFlag.CONNECTED, **command.args), client)
+
+    def capture(self):
+        transport = SocketPairTransport()
+        server = CommandServer(transport=transport)
+        server.start_capture(self.path)
+        thread = threading.Thread(target=self.echo, args=(server, 2, 2), daemon=True)
+        thread.start()
+        clients = [CommandClient(transport=transport) for _ in range(2)]
+        for i in range(2):
+            for client in clients:
+                client.send(ClientCommand(NetworkFlag.CONNECTED, i=i))
+                client.recv()
+        thread.join()
+        server.stop_capture()
+
+    def replay(self, amount, rounds, **kwargs):
+        transport = SocketPairTransport()
+        server = CommandServer(transport=transport)
+        thread = threading.Thread(target=self.echo, args=(server, amount, rounds), daemon=True)
+        thread.start()
+        stats = Replayer(self.path, transport=transport, **kwargs).replay()
+        thread.join()
+        return stats
+
+    def test_replay_as_fast_as_possible(self):
+        self.capture()
+        stats = self.replay(4, 2, speed=0, scale=2)
+        self.assertEqual(stats.errors, [])
+        self.assertEqual((stats.frames_sent, stats.frames_received), (8, 8))
+
+    def test_replay_skips_idle_time_before_first_frame(self):
+        # A session whose first frame was captured a minute after the capture started
+        frame = ClientCommand(NetworkFlag.CONNECTED, i=0).serialize().encode()
+        reply = ServerCommand(NetworkFlag.CONNECTED, i=0).serialize().encode()
+        with open(self.path, "wb") as file:
+            file.write(FILE_HEADER.pack(MAGIC, time.time_ns()))
+            for timestamp, direction, payload in ((60_000_000_000, Direction.INBOUND, frame),
+                                                  (60_001_000_000, Direction.OUTBOUND, reply)):
+                file.write(RECORD_HEADER.pack(timestamp, 0, direction, 0, len(payload)) + payload)
+        stats = self.replay(1, 1, speed=1)
+        self.assertEqual(stats.errors, [])
+        self.assertLess(stats.elapsed, 30)
+
+    def test_replay_times_out_on_missing_reply(self):
+        self.capture()
+        transport = SocketPairTransport()
+        server = CommandServer(transport=transport)
+
+        def drop_replies():
+            server.accept(2)
+            for client in server.clients:
+                server.recv(client)
+
+        thread = threading.Thread(target=drop_replies, daemon=True)
+        thread.start()
+        stats = Replayer(self.path, speed=0, timeout=0.2, transport=transport).replay()
+        thread.join()
+        self.assertEqual(len(stats.errors), 2)
+        self.assertTrue(all(isinstance(error, TimeoutError) for error in stats.errors))
+        self.assertEqual((stats.frames_sent, stats.frames_received), (2, 0))
+
+    def test_connect_error_is_not_hidden(self):
+        with CaptureWriter(self.path) as writer:
+            writer.record(Direction.INBOUND, 0, b"{}")
+        with self.assertRaises(ConnectionRefusedError):
+            Replayer(self.path).replay("localhost", 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
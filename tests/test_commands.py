@@ -0,0 +1,95 @@
+import json
+import threading
+import unittest
+
+from py_mp import CommandServer, ServerCommand
+from py_mp.commands import BaseCommand, LazyCommand, NetworkFlag
+from py_mp.network import NetworkClient, SocketPairTransport
+
+
+class BaseCommandTest(unittest.TestCase):
+    def test_round_trip(self):
+        command = BaseCommand.deserialize(ServerCommand(NetworkFlag.CONNECTED, a=1).serialize())
+        self.assertEqual((command.flag, command.args), (NetworkFlag.CONNECTED, {"a": 1}))
+
+
+class LazyCommandTest(unittest.TestCase):
+    def test_flag_fast_path(self):
+        command = LazyCommand(ServerCommand(NetworkFlag.DISCONNECTED, a=1).serialize().encode())
+        self.assertEqual(command.flag, NetworkFlag.DISCONNECTED)
+        self.assertIn("args: ...", repr(command))
+        self.assertEqual(command.args, {"a": 1})
+
+    def test_flag_fallback(self):
+        command = LazyCommand(b'{"args": {"a": 1}, "flag": 101}')
+        self.assertEqual(command.flag, NetworkFlag.CONNECTED)
+        self.assertEqual(command.args, {"a": 1})
+
+    def test_untouched_frame_is_original(self):
+        frame = b'{"flag": 101, "args": {"a":1}}'
+        command = LazyCommand(frame)
+        self.assertEqual(bytes(command.frame), frame)
+        self.assertEqual(command.serialize(), frame.decode())
+
+    def test_frame_after_args_read_is_original(self):
+        command = LazyCommand(b'{"flag": 101, "args": {"a":1}}')
+        self.assertEqual(command.args["a"], 1)
+        self.assertIs(command.frame, command.raw)
+
+    def test_frame_after_args_replaced(self):
+        command = LazyCommand(b'{"flag": 101, "args": {"a": 1}}')
+        command.args = {"b": 2}
+        self.assertEqual(json.loads(bytes(command.frame)), {"flag": 101, "args": {"b": 2}})
+
+    def test_frame_after_args_changed_in_place(self):
+        command = LazyCommand(b'{"flag": 101, "args": {"a": 1}}')
+        command.args["a"] = 2
+        self.assertEqual(json.loads(bytes(command.frame)), {"flag": 101, "args": {"a": 2}})
+
+
+class ForwardTest(unittest.TestCase):
+    def setUp(self):
+        transport = SocketPairTransport()
+        self.server = CommandServer(transport=transport)
+        thread = threading.Thread(target=self.server.accept, args=(2,), daemon=True)
+        thread.start()
+        # Plain NetworkClients to see the exact frames, the spacing differs from json.dumps
+        self.clients = [NetworkClient(transport=transport) for _ in range(2)]
+        thread.join()
+
+    FRAME = '{"flag": 101, "args": {"a":1}}'
+
+    def relay(self, change):
+        def run():
+            command = self.server.recv_lazy(self.server.clients[0])
+            change(command)
+            self.server.forward(command, self.server.clients[1])
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        self.clients[0].send(self.FRAME)
+        received = self.clients[1].recv()
+        thread.join()
+        return received
+
+    def test_forward_untouched(self):
+        self.assertEqual(self.relay(lambda command: None), self.FRAME)
+
+    def test_forward_after_args_read(self):
+        def read(command):
+            self.assertEqual(command.args["a"], 1)
+        self.assertEqual(self.relay(read), self.FRAME)
+
+    def test_forward_after_args_replaced(self):
+        def replace(command):
+            command.args = {"b": 2}
+        self.assertEqual(json.loads(self.relay(replace)), {"flag": 101, "args": {"b": 2}})
+
+    def test_forward_after_args_changed_in_place(self):
+        def change(command):
+            command.args["a"] = 2
+        self.assertEqual(json.loads(self.relay(change)), {"flag": 101, "args": {"a": 2}})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import threading
+import unittest
+
+from py_mp import CommandServer, CommandClient, ServerCommand
+from py_mp.commands import NetworkFlag
+from py_mp.network import SnapshotBuffer, SocketPairTransport
+
+
+def state(flag=NetworkFlag.CONNECTED, **kwargs):
+    return ServerCommand(flag, **kwargs)
+
+
+class SnapshotBufferTest(unittest.TestCase):
+    def setUp(self):
+        self.buffer = SnapshotBuffer([NetworkFlag.CONNECTED], size=3)
+
+    def test_ignores_other_flags(self):
+        self.assertFalse(self.buffer.push(state(NetworkFlag.DISCONNECTED), 1.0))
+        self.assertEqual(len(self.buffer), 0)
+        self.assertIsNone(self.buffer.sample(1.0))
+
+    def test_push_keeps_time_order(self):
+        self.buffer.push(state(x=1.0), 1.0)
+        self.buffer.push(state(x=3.0), 3.0)
+        self.buffer.push(state(x=2.0), 2.0)
+        self.assertEqual(self.buffer.sample(1.5).args, {"x": 1.5})
+        self.assertEqual(self.buffer.sample(2.5).args, {"x": 2.5})
+
+    def test_push_drops_oldest_when_full(self):
+        for t in (1.0, 2.0, 3.0, 4.0):
+            self.assertTrue(self.buffer.push(state(x=t), t))
+        self.assertEqual(len(self.buffer), 3)
+        self.assertEqual(self.buffer.sample(1.0).args, {"x": 2.0})
+        # Older than every snapshot of the full buffer
+        self.assertFalse(self.buffer.push(state(x=0.0), 0.0))
+
+    def test_sample_edges(self):
+        self.buffer.push(state(x=1.0), 1.0)
+        self.buffer.push(state(x=2.0), 2.0)
+        self.assertEqual(self.buffer.sample(0.0).args, {"x": 1.0})
+        self.assertEqual(self.buffer.sample(1.0).args, {"x": 1.0})
+        self.assertEqual(self.buffer.sample(2.0).args, {"x": 2.0})
+        self.assertEqual(self.buffer.sample(9.0).args, {"x": 2.0})
+
+    def test_sample_midpoint(self):
+        self.buffer.push(state(pos=[0.0, 10.0], unit={"hp": 10.0}, id=1, name="a", alive=True), 1.0)
+        self.buffer.push(state(pos=[10.0, 20.0], unit={"hp": 20.0}, id=3, name="b", alive=False), 2.0)
+        self.assertEqual(self.buffer.sample(1.5).args,
+                         {"pos": [5.0, 15.0], "unit": {"hp": 15.0}, "id": 1, "name": "a", "alive": True})
+
+    def test_no_interpolation_across_flags(self):
+        buffer = SnapshotBuffer([NetworkFlag.CONNECTED, NetworkFlag.DISCONNECTED])
+        buffer.push(state(NetworkFlag.CONNECTED, x=0.0), 1.0)
+        buffer.push(state(NetworkFlag.DISCONNECTED, x=10.0), 2.0)
+        sample = buffer.sample(1.5)
+        self.assertEqual((sample.flag, sample.args), (NetworkFlag.CONNECTED, {"x": 0.0}))
+
+    def test_command_client_pushes_received_commands(self):
+        transport = SocketPairTransport()
+        server = CommandServer(transport=transport)
+        thread = threading.Thread(target=server.accept, daemon=True)
+        thread.start()
+        client = CommandClient(transport=transport, snapshots=SnapshotBuffer([NetworkFlag.CONNECTED]))
+        thread.join()
+        thread = threading.Thread(target=server.send, args=(state(x=1.0), server.clients[0]), daemon=True)
+        thread.start()
+        client.recv()
+        thread.join()
+        self.assertEqual(client.snapshots.sample().args, {"x": 1.0})
+
+
+if __name__ == '__main__':
+    unittest.main()
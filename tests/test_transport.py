@@ -0,0 +1,85 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from py_mp import CommandServer, CommandClient, ClientCommand, ServerCommand
+from py_mp.capture import Replayer
+from py_mp.commands import NetworkFlag
+from py_mp.network import TransportBase, UnixTransport, SocketPairTransport
+
+
+class TransportTest(unittest.TestCase):
+    def exchange(self, server, make_client, amount=2):
+        def serve():
+            server.accept(amount)
+            for client in server.clients:
+                command = server.recv(client)
+                server.send(ServerCommand(NetworkFlag.CONNECTED, echo=command.args["i"]), client)
+
+        # Listen before the clients connect, accept() listens again with the same backlog
+        server.transport.listen(server.conn, amount)
+        thread = threading.Thread(target=serve, daemon=True)
+        thread.start()
+        clients = [make_client() for _ in range(amount)]
+        for i, client in enumerate(clients):
+            client.send(ClientCommand(NetworkFlag.CONNECTED, i=i))
+            self.assertEqual(client.recv().args, {"echo": i})
+        thread.join()
+        for client in clients:
+            client.conn.close()
+        if server.conn is not None:
+            server.conn.close()
+
+    def test_transport_base_is_abstract(self):
+        with self.assertRaises(TypeError):
+            TransportBase()  # pylint: disable=abstract-class-instantiated
+
+    def test_unix_exchange(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "py_mp.sock")
+            server = CommandServer(path, transport=UnixTransport())
+            self.assertTrue(server.is_binded())
+            self.exchange(server, lambda: CommandClient(transport=UnixTransport(path)))
+            self.assertEqual([(client.address, client.port) for client in server.clients], [("", 0), ("", 0)])
+            self.assertNotEqual(server.clients[0], server.clients[1])
+
+    def test_unix_rebind_stale_socket_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "py_mp.sock")
+            CommandServer(transport=UnixTransport(path)).conn.close()
+            server = CommandServer(transport=UnixTransport(path))
+            self.exchange(server, lambda: CommandClient(path, transport=UnixTransport()), amount=1)
+
+    def test_unix_bind_live_socket_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "py_mp.sock")
+            server = CommandServer(path, transport=UnixTransport())
+            server.transport.listen(server.conn, 1)
+            with self.assertRaises(OSError):
+                CommandServer(path, transport=UnixTransport())
+            # The first server still owns the socket file
+            client = CommandClient(path, transport=UnixTransport())
+            self.assertTrue(client.is_connected())
+            client.conn.close()
+            server.conn.close()
+
+    def test_socketpair_exchange(self):
+        transport = SocketPairTransport()
+        server = CommandServer(transport=transport)
+        self.exchange(server, lambda: CommandClient(transport=transport))
+        self.assertNotEqual(server.clients[0], server.clients[1])
+
+    def test_tcp_requires_host_and_port(self):
+        client = CommandClient()
+        self.assertFalse(client.is_connected())
+        with self.assertRaises(ValueError):
+            client.connect()
+
+    def test_replay_without_address(self):
+        with self.assertRaises(ValueError):
+            Replayer("does-not-exist.pymp").replay()
+
+
+if __name__ == '__main__':
+    unittest.main()